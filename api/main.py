@@ -131,6 +131,40 @@ class USPSRateLimiter:
 # Initialize rate limiter (2 calls per second to be safe)
 usps_rate_limiter = USPSRateLimiter(calls_per_second=2.0)
 
+# Precompiled patterns and interned state sets - built once at import so the
+# categorization hot loops never recompile or rebuild them
+_US_ZIP_PATTERNS = (
+    re.compile(r'^\d{5}$'),           # 12345
+    re.compile(r'^\d{9}$'),           # 123456789 (ZIP+4 without dash)
+    re.compile(r'^\d{5}-?\d{4}$')    # 12345-6789
+)
+
+_INTERNATIONAL_ZIP_PATTERNS = (
+    (re.compile(r'^[A-Z]\d[A-Z]\s?\d[A-Z]\d$'), 'Canadian postal code'),
+    (re.compile(r'^[A-Z]{1,2}\d[A-Z\d]?\s?\d[A-Z]{2}$'), 'UK postal code'),
+    (re.compile(r'^[0-9]{5}$'), 'German postal code (5 digits)'),
+    (re.compile(r'^[0-9]{4}$'), 'Australian postal code'),
+    (re.compile(r'^[0-9]{4}\s?[A-Z]{2}$'), 'Dutch postal code'),
+    (re.compile(r'^[0-9]{3}\s?[0-9]{2}$'), 'Nordic postal code'),
+    (re.compile(r'^\d{3}-?\d{4}$'), 'Japanese postal code'),
+    (re.compile(r'^\d{5}-?\d{3}$'), 'Brazilian postal code'),
+    (re.compile(r'^[0-9]{6}$'), 'Indian/Chinese postal code'),
+    (re.compile(r'^[A-Z]{2,4}\s?[0-9]{3,5}$'), 'International postal code (letters + numbers)'),
+    (re.compile(r'^[0-9]{6,8}$'), 'International postal code (6-8 digits)'),
+    (re.compile(r'^[A-Z0-9]{5,10}$'), 'International postal code (alphanumeric)')
+)
+
+_STRICT_US_ZIP_RE = re.compile(r'^\d{5}(?:-\d{4})?$')
+_CITY_RE = re.compile(r"^[A-Za-z\s\.\-\']+$")
+
+_VALID_STATE_CODES = frozenset({
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
+})
+
 # Enhanced state normalization for API
 class StateNormalizer:
     """State name to code normalization for API"""
@@ -166,13 +200,7 @@ class StateNormalizer:
             'dc': 'DC', 'd.c.': 'DC', 'washington dc': 'DC', 'washington d.c.': 'DC'
         }
         
-        self.valid_state_codes = {
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-        }
+        self.valid_state_codes = _VALID_STATE_CODES
     
     def normalize_state(self, state_input: str) -> tuple:
         """Normalize state input to standard 2-letter code"""
@@ -209,37 +237,15 @@ class AddressCategorizer:
         if not zip_code:
             return {'type': 'invalid', 'reason': 'Empty ZIP code'}
         
-        # US ZIP patterns
-        us_patterns = [
-            r'^\d{5}$',           # 12345
-            r'^\d{9}$',           # 123456789 (ZIP+4 without dash)
-            r'^\d{5}-?\d{4}$'     # 12345-6789
-        ]
-        
-        for pattern in us_patterns:
-            if re.match(pattern, zip_code.strip()):
+        zip_stripped = zip_code.strip()
+        for pattern in _US_ZIP_PATTERNS:
+            if pattern.match(zip_stripped):
                 return {'type': 'us', 'reason': 'US ZIP code format'}
         
-        # International postal code patterns
-        international_patterns = {
-            r'^[A-Z]\d[A-Z]\s?\d[A-Z]\d$': 'Canadian postal code',
-            r'^[A-Z]{1,2}\d[A-Z\d]?\s?\d[A-Z]{2}$': 'UK postal code',
-            r'^[0-9]{5}$': 'German postal code (5 digits)',
-            r'^[0-9]{4}$': 'Australian postal code',
-            r'^[0-9]{4}\s?[A-Z]{2}$': 'Dutch postal code',
-            r'^[0-9]{3}\s?[0-9]{2}$': 'Nordic postal code',
-            r'^\d{3}-?\d{4}$': 'Japanese postal code',
-            r'^\d{5}-?\d{3}$': 'Brazilian postal code',
-            r'^[0-9]{6}$': 'Indian/Chinese postal code',
-            r'^[A-Z]{2,4}\s?[0-9]{3,5}$': 'International postal code (letters + numbers)',
-            r'^[0-9]{6,8}$': 'International postal code (6-8 digits)',
-            r'^[A-Z0-9]{5,10}$': 'International postal code (alphanumeric)'
-        }
+        zip_upper = zip_stripped.upper()
         
-        zip_upper = zip_code.strip().upper()
-        
-        for pattern, description in international_patterns.items():
-            if re.match(pattern, zip_upper):
+        for pattern, description in _INTERNATIONAL_ZIP_PATTERNS:
+            if pattern.match(zip_upper):
                 return {'type': 'international', 'reason': description}
         
         return {'type': 'invalid', 'reason': 'Unrecognized postal code format'}
@@ -342,7 +348,7 @@ class AddressCategorizer:
         
         # Validate ZIP code format
         zip_code = address_data['zip'].strip()
-        if not re.match(r'^\d{5}(-\d{4})?$', zip_code):
+        if not _STRICT_US_ZIP_RE.match(zip_code):
             issues.append("ZIP code must be 5 digits or ZIP+4 format")
         
         # Basic validations
@@ -351,11 +357,169 @@ class AddressCategorizer:
         
         if len(address_data['city'].strip()) < 2:
             issues.append("City name too short")
-        elif not re.match(r'^[A-Za-z\s\.\-\']+$', address_data['city'].strip()):
+        elif not _CITY_RE.match(address_data['city'].strip()):
             issues.append("City contains invalid characters")
         
         return {'valid': len(issues) == 0, 'issues': issues}
 
+    @staticmethod
+    def categorize_batch(df: pd.DataFrame, source_file: str = "api", start_row: int = 1) -> List[Dict]:
+        """Categorize a DataFrame of addresses with vectorized column operations
+
+        Produces the same per-row result dicts as categorize_address, but runs
+        the hot checks (state normalization, ZIP format, missing fields) as
+        pandas column operations instead of per-row Python. Only non-US postal
+        codes fall back to analyze_zip_code for their reason strings.
+        """
+        if df.empty:
+            return []
+
+        index = df.index
+
+        def _column(name, default=''):
+            if name in df.columns:
+                return df[name].fillna(default).astype(str)
+            return pd.Series([default] * len(df), index=index)
+
+        line1 = _column('line1')
+        line2 = _column('line2')
+        city = _column('city')
+        state = _column('stateCd')
+        zip_cd = _column('zipCd')
+        country = _column('countryCd', 'US').str.upper()
+
+        # Vectorized state normalization: valid 2-letter code, exact name
+        # match, then punctuation-stripped name match (mirrors normalize_state)
+        state_stripped = state.str.strip()
+        state_upper = state_stripped.str.upper()
+        state_lower = state_stripped.str.lower()
+
+        is_code = (state_stripped.str.len() == 2) & state_upper.isin(state_normalizer.valid_state_codes)
+        mapped = state_lower.map(state_normalizer.state_name_to_code)
+        mapped_no_punct = state_lower.str.replace('.', '', regex=False) \
+                                     .str.replace(',', '', regex=False) \
+                                     .map(state_normalizer.state_name_to_code)
+
+        resolved = state_upper.where(is_code, mapped.fillna(mapped_no_punct))
+        is_valid_state = resolved.notna()
+        normalized_state = resolved.fillna(state_upper)
+        norm_applied = normalized_state != state_upper
+
+        # Missing required fields
+        missing_line1 = line1.str.strip() == ''
+        missing_city = city.str.strip() == ''
+        missing_state = state_stripped == ''
+        missing_zip = zip_cd.str.strip() == ''
+
+        # Explicitly international country
+        intl_country = (country != '') & (country != 'US') & (country != 'USA')
+
+        # ZIP format checks
+        zip_stripped = zip_cd.str.strip()
+        us_zip = (zip_stripped.str.match(_US_ZIP_PATTERNS[0])
+                  | zip_stripped.str.match(_US_ZIP_PATTERNS[1])
+                  | zip_stripped.str.match(_US_ZIP_PATTERNS[2]))
+        strict_zip = zip_stripped.str.match(_STRICT_US_ZIP_RE)
+
+        # US format validation
+        city_stripped = city.str.strip()
+        line1_ok = line1.str.strip().str.len() >= 3
+        city_len_ok = city_stripped.str.len() >= 2
+        city_chars_ok = city_stripped.str.match(_CITY_RE)
+        us_ok = is_valid_state & strict_zip & line1_ok & city_len_ok & city_chars_ok
+
+        # Materialize columns once for the per-row result assembly
+        cols = {
+            'line1': line1.tolist(),
+            'line2': line2.tolist(),
+            'city': city.tolist(),
+            'state': state.tolist(),
+            'zip': zip_cd.tolist(),
+            'country': country.tolist(),
+            'state_stripped': state_stripped.tolist(),
+            'normalized_state': normalized_state.tolist(),
+            'norm_applied': norm_applied.tolist(),
+            'is_valid_state': is_valid_state.tolist(),
+            'missing_line1': missing_line1.tolist(),
+            'missing_city': missing_city.tolist(),
+            'missing_state': missing_state.tolist(),
+            'missing_zip': missing_zip.tolist(),
+            'intl_country': intl_country.tolist(),
+            'us_zip': us_zip.tolist(),
+            'strict_zip': strict_zip.tolist(),
+            'line1_ok': line1_ok.tolist(),
+            'city_len_ok': city_len_ok.tolist(),
+            'city_chars_ok': city_chars_ok.tolist(),
+            'us_ok': us_ok.tolist()
+        }
+
+        results = []
+        for i in range(len(df)):
+            address_parts = [part for part in (cols['line1'][i], cols['line2'][i],
+                                               cols['city'][i], cols['state'][i],
+                                               cols['zip'][i]) if part]
+            result = {
+                'row_number': start_row + i,
+                'source_file': source_file,
+                'category': 'invalid',
+                'issues': [],
+                'line1': cols['line1'][i],
+                'line2': cols['line2'][i],
+                'city': cols['city'][i],
+                'state': cols['state'][i],
+                'zip': cols['zip'][i],
+                'country': cols['country'][i],
+                'complete_address': ', '.join(address_parts),
+                'validation_notes': '',
+                'normalized_state': cols['normalized_state'][i],
+                'state_normalization_applied': bool(cols['norm_applied'][i])
+            }
+
+            if cols['intl_country'][i]:
+                result['category'] = 'international'
+                result['validation_notes'] = f"International address (Country: {result['country']})"
+            elif cols['missing_line1'][i] or cols['missing_city'][i] or cols['missing_state'][i] or cols['missing_zip'][i]:
+                missing_fields = []
+                if cols['missing_line1'][i]: missing_fields.append("street address")
+                if cols['missing_city'][i]: missing_fields.append("city")
+                if cols['missing_state'][i]: missing_fields.append("state")
+                if cols['missing_zip'][i]: missing_fields.append("zip code")
+                result['issues'] = [f"Missing: {', '.join(missing_fields)}"]
+                result['validation_notes'] = f"Invalid - Missing required fields: {', '.join(missing_fields)}"
+            elif not cols['us_zip'][i]:
+                zip_analysis = AddressCategorizer.analyze_zip_code(result['zip'])
+                if zip_analysis['type'] == 'international':
+                    result['category'] = 'international'
+                    result['validation_notes'] = f"International address - {zip_analysis['reason']}"
+                else:
+                    result['issues'] = [zip_analysis['reason']]
+                    result['validation_notes'] = f"Invalid - {zip_analysis['reason']}"
+            elif cols['us_ok'][i]:
+                result['category'] = 'us_valid'
+                result['state'] = cols['normalized_state'][i]
+                if result['state_normalization_applied']:
+                    result['validation_notes'] = f"Valid US address - State normalized from '{cols['state_stripped'][i]}' to '{cols['normalized_state'][i]}'"
+                else:
+                    result['validation_notes'] = "Valid US address - Ready for USPS validation"
+            else:
+                issues = []
+                if not cols['is_valid_state'][i]:
+                    issues.append(f"Invalid US state: '{result['state']}' (not recognized as state name or code)")
+                if not cols['strict_zip'][i]:
+                    issues.append("ZIP code must be 5 digits or ZIP+4 format")
+                if not cols['line1_ok'][i]:
+                    issues.append("Street address too short")
+                if not cols['city_len_ok'][i]:
+                    issues.append("City name too short")
+                elif not cols['city_chars_ok'][i]:
+                    issues.append("City contains invalid characters")
+                result['issues'] = issues
+                result['validation_notes'] = f"Invalid - {'; '.join(issues)}"
+
+            results.append(result)
+
+        return results
+
 # Initialize categorizer
 address_categorizer = AddressCategorizer()
 
@@ -5,8 +5,18 @@ Provides easy-to-use client for name and address validation services
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
+from requests_toolbelt import MultipartEncoder
 import time
+import random
+import threading
+import hashlib
+import concurrent.futures
+import asyncio
+import aiohttp
 from typing import List, Dict, Optional, Union
 from dataclasses import dataclass
 from pathlib import Path
@@ -22,7 +32,7 @@ class ValidationResult:
     rate_limit_remaining: Optional[int] = None
     processing_time: Optional[float] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AddressRecord:
     """Address record for validation"""
     guid: str
@@ -33,7 +43,7 @@ class AddressRecord:
     line2: Optional[str] = None
     country_cd: str = "US"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NameRecord:
     """Name record for validation"""
     unique_id: str
@@ -42,6 +52,73 @@ class NameRecord:
     party_type_cd: str = ""
     parse_ind: str = "Y"
 
+# Slotted records have no __dict__; build payload dicts from these
+# field tuples instead (cheaper than dataclasses.asdict's deep copy)
+_ADDRESS_FIELDS = ('guid', 'line1', 'city', 'state_cd', 'zip_cd', 'line2', 'country_cd')
+_NAME_FIELDS = ('unique_id', 'full_name', 'gender_cd', 'party_type_cd', 'parse_ind')
+
+def _address_dict(addr: AddressRecord) -> Dict:
+    return {f: getattr(addr, f) for f in _ADDRESS_FIELDS}
+
+def _name_dict(name: NameRecord) -> Dict:
+    return {f: getattr(name, f) for f in _NAME_FIELDS}
+
+# Column order for CSV export; fixed so rows can stream without
+# peeking at the first result to discover the header
+FIELDS = ('source_file', 'row_number', 'category', 'input_address',
+          'output_address', 'usps_valid', 'county', 'is_residential',
+          'error_message')
+
+def _iter_rows(results: Dict):
+    """Lazily yield export rows as tuples in FIELDS order"""
+    categorized = results['categorized_results']
+    
+    # USPS validated addresses
+    for result in categorized.get('usps_validated_addresses', []):
+        yield (
+            result.get('source_file', ''),
+            result.get('row_number', ''),
+            'US_USPS_Validated',
+            result.get('input_address', ''),
+            result.get('standardized_address', ''),
+            result.get('usps_valid', False),
+            result.get('county', ''),
+            result.get('is_residential', ''),
+            result.get('error_message', '')
+        )
+    
+    # International addresses
+    for result in categorized.get('international_addresses', []):
+        complete_address = result.get('complete_address', '')
+        yield (
+            result.get('source_file', ''),
+            result.get('row_number', ''),
+            'International',
+            complete_address,
+            complete_address,
+            False,
+            '',
+            '',
+            ''
+        )
+    
+    # Invalid addresses
+    for result in categorized.get('invalid_addresses', []):
+        issues = result.get('issues', [])
+        issues_text = '; '.join(issues) if isinstance(issues, list) else str(issues)
+        
+        yield (
+            result.get('source_file', ''),
+            result.get('row_number', ''),
+            'Invalid',
+            result.get('complete_address', ''),
+            '',
+            False,
+            '',
+            '',
+            issues_text
+        )
+
 class AddressValidatorClient:
     """
     Professional client for Address Validator API
@@ -51,7 +128,8 @@ class AddressValidatorClient:
         result = client.validate_address("123 Main St", "New York", "NY", "10001")
     """
     
-    def __init__(self, api_key: str, base_url: str, timeout: int = 30):
+    def __init__(self, api_key: str, base_url: str, timeout: int = 30,
+                 pool_size: int = 32, use_http2: bool = False):
         """
         Initialize the client
         
@@ -59,32 +137,215 @@ class AddressValidatorClient:
             api_key: Your API key
             base_url: Base URL of the API (e.g., https://your-api.railway.app)
             timeout: Request timeout in seconds
+            pool_size: Connection pool size (urllib3 defaults to 10, which
+                caps throughput for threaded callers)
+            use_http2: Route requests through an HTTP/2 httpx client so
+                concurrent calls multiplex over one connection (requires
+                the optional httpx package)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
+        self.pool_size = pool_size
         
-        # Set default headers
-        self.session.headers.update({
+        # Final request headers, built once; passed per request instead
+        # of relying on session-level header merging
+        self._base_headers = {
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json',
             'User-Agent': 'AddressValidatorClient/2.0.0'
-        })
+        }
+        
+        # Bulkhead: interactive validations and bulk CSV/batch posts get
+        # independent sessions so a backlog of slow uploads cannot starve
+        # the pool that serves fast UI calls
+        self._interactive_session = self._build_session(pool_size)
+        self._bulk_session = self._build_session(4)
+        self.session = self._interactive_session
         
-        # Track usage
+        # Optional HTTP/2 client
+        self._http2_client = None
+        if use_http2:
+            import httpx
+            self._http2_client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=pool_size,
+                                    max_keepalive_connections=pool_size),
+                headers=self._base_headers,
+                timeout=timeout
+            )
+        
+        # Track usage; the lock keeps counts exact under the threaded
+        # batch pipeline and async gather paths
+        self._stats_lock = threading.Lock()
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
-    
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> ValidationResult:
-        """Make authenticated request to API"""
+        self.retried_requests = 0
+
+        # TTL cache for read-only GET endpoints keyed by endpoint path
+        self._cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+
+        # In-flight request map for single-flight deduplication
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Known-bad credentials: after a definitive 401, skip the
+        # network entirely for a short window
+        self._auth_blocked_until = 0.0
+
+        # Circuit breaker: fail fast instead of paying the full timeout
+        # on every call while the API is down
+        self._cb_state = 'closed'
+        self._cb_failures = 0
+        self._cb_opened_at = 0.0
+        self._cb_threshold = 5
+        self._cb_cooldown = 30.0
+
+        # Lazily-created aiohttp session shared by the async batch path,
+        # along with the event loop it is bound to
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        self._aio_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _build_session(self, pool_maxsize: int) -> requests.Session:
+        """Create a session with a sized keep-alive connection pool"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=0)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _request_http2(self, method: str, url: str, **kwargs):
+        """Issue a request on the HTTP/2 client with requests-compatible semantics
+
+        Translates raw-bytes bodies to httpx's content= argument and maps
+        httpx transport errors onto the requests exception types that
+        _make_request's handlers (and the circuit breaker) expect.
+        """
+        import httpx
+        data = kwargs.pop('data', None)
+        if data is not None:
+            kwargs['content'] = data
+        try:
+            return self._http2_client.request(method, url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+    # Endpoints served from the small bulk pool
+    _BULK_ENDPOINT_PREFIXES = ('/api/batch-',)
+
+    def session_for(self, endpoint: str) -> requests.Session:
+        """Pick the session whose connection pool serves this endpoint"""
+        if endpoint.startswith(self._BULK_ENDPOINT_PREFIXES):
+            return self._bulk_session
+        return self._interactive_session
+
+    def _cb_record_failure(self):
+        """Count a connection-level or 5xx failure; trip the breaker at threshold"""
+        self._cb_failures += 1
+        if self._cb_state == 'half_open' or self._cb_failures >= self._cb_threshold:
+            self._cb_state = 'open'
+            self._cb_opened_at = time.monotonic()
+
+    def _cb_record_success(self):
+        """Reset the breaker after a successful response"""
+        self._cb_failures = 0
+        self._cb_state = 'closed'
+
+    # Transient statuses worth retrying: throttled or upstream hiccup
+    _RETRY_STATUSES = (429, 502, 503, 504)
+
+    # Canned messages for statuses that carry no useful body
+    _STATUS_ERRORS = {
+        401: "Invalid API key. Please check your credentials.",
+        403: "Access forbidden. Feature may not be available in your tier.",
+        429: "Rate limit exceeded. Please slow down your requests.",
+    }
+    _RETRY_BASE_DELAY = 0.5
+    _RETRY_MAX_DELAY = 10.0
+
+    def _make_request(self, method: str, endpoint: str,
+                      max_retries: int = 3, **kwargs) -> ValidationResult:
+        """Make authenticated request to API, retrying transient failures
+
+        Retries 429/502/503/504 responses up to max_retries attempts,
+        honoring the server's Retry-After header when present and
+        otherwise sleeping with exponential backoff and full jitter.
+        POSTs are only retried when the caller supplies an
+        Idempotency-Key header, since replaying them is unsafe otherwise.
+        """
         start_time = time.time()
         url = f"{self.base_url}{endpoint}"
         
+        # Use the precomputed headers; caller-supplied entries override
+        # individual keys without losing the auth header
+        headers = kwargs.get('headers')
+        kwargs['headers'] = ({**self._base_headers, **headers} if headers
+                             else self._base_headers)
+        retryable = (method == 'GET'
+                     or 'Idempotency-Key' in kwargs['headers'])
+        # The HTTP/2 client only understands JSON/raw-bytes bodies;
+        # multipart uploads (files=, MultipartEncoder data=) stay on the
+        # requests session
+        use_http2 = (self._http2_client is not None
+                     and 'files' not in kwargs
+                     and isinstance(kwargs.get('data'), (bytes, str, type(None))))
+        
+        if time.monotonic() < self._auth_blocked_until:
+            with self._stats_lock:
+                self.failed_requests += 1
+            return ValidationResult(
+                success=False,
+                data={},
+                error='auth_cached_invalid',
+                processing_time=0.0
+            )
+        
+        # Short-circuit while the breaker is open; after the cooldown let
+        # one probe request through (half-open)
+        if self._cb_state == 'open':
+            if time.monotonic() - self._cb_opened_at < self._cb_cooldown:
+                with self._stats_lock:
+                    self.failed_requests += 1
+                return ValidationResult(
+                    success=False,
+                    data={},
+                    error='circuit_open',
+                    processing_time=0.0
+                )
+            self._cb_state = 'half_open'
+        
         try:
-            self.total_requests += 1
-            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            with self._stats_lock:
+                self.total_requests += 1
+            for attempt in range(max_retries):
+                if use_http2:
+                    response = self._request_http2(method, url, **kwargs)
+                else:
+                    response = self.session_for(endpoint).request(
+                        method, url, timeout=self.timeout, **kwargs)
+                if (response.status_code not in self._RETRY_STATUSES
+                        or not retryable or attempt == max_retries - 1):
+                    break
+                retry_after = response.headers.get('Retry-After')
+                try:
+                    # Clamp server-supplied delays so a large Retry-After
+                    # cannot stall the calling thread (and any single-flight
+                    # followers) for minutes
+                    delay = min(float(retry_after), self._RETRY_MAX_DELAY)
+                except (TypeError, ValueError):
+                    delay = min(self._RETRY_MAX_DELAY,
+                                self._RETRY_BASE_DELAY * 2 ** attempt) * random.random()
+                with self._stats_lock:
+                    self.retried_requests += 1
+                time.sleep(delay)
             processing_time = time.time() - start_time
             
             # Extract rate limit info from headers
@@ -92,28 +353,35 @@ class AddressValidatorClient:
             if rate_limit_remaining:
                 rate_limit_remaining = int(rate_limit_remaining)
             
-            if response.status_code == 200:
-                self.successful_requests += 1
+            status = response.status_code
+            if status == 200:
+                with self._stats_lock:
+                    self.successful_requests += 1
+                self._cb_record_success()
+                self._auth_blocked_until = 0.0
                 return ValidationResult(
                     success=True,
-                    data=response.json(),
+                    data=orjson.loads(response.content),
                     rate_limit_remaining=rate_limit_remaining,
                     processing_time=processing_time
                 )
-            elif response.status_code == 401:
-                error_msg = "Invalid API key. Please check your credentials."
-            elif response.status_code == 403:
-                error_msg = "Access forbidden. Feature may not be available in your tier."
-            elif response.status_code == 429:
-                error_msg = "Rate limit exceeded. Please slow down your requests."
-            else:
+            
+            # 401 means the key itself is bad; 403 is a per-feature tier
+            # restriction and must not block unrelated calls
+            if status == 401:
+                self._auth_blocked_until = time.monotonic() + 30
+            error_msg = self._STATUS_ERRORS.get(status)
+            if error_msg is None:
                 try:
-                    error_data = response.json()
-                    error_msg = error_data.get('detail', {}).get('message', f"HTTP {response.status_code}")
-                except:
-                    error_msg = f"HTTP {response.status_code}: {response.text}"
+                    error_data = orjson.loads(response.content)
+                    error_msg = error_data.get('detail', {}).get('message', f"HTTP {status}")
+                except orjson.JSONDecodeError:
+                    error_msg = f"HTTP {status}: {response.text}"
             
-            self.failed_requests += 1
+            if status >= 500:
+                self._cb_record_failure()
+            with self._stats_lock:
+                self.failed_requests += 1
             return ValidationResult(
                 success=False,
                 data={},
@@ -123,7 +391,9 @@ class AddressValidatorClient:
             )
             
         except requests.exceptions.Timeout:
-            self.failed_requests += 1
+            self._cb_record_failure()
+            with self._stats_lock:
+                self.failed_requests += 1
             return ValidationResult(
                 success=False,
                 data={},
@@ -131,7 +401,9 @@ class AddressValidatorClient:
                 processing_time=time.time() - start_time
             )
         except requests.exceptions.ConnectionError:
-            self.failed_requests += 1
+            self._cb_record_failure()
+            with self._stats_lock:
+                self.failed_requests += 1
             return ValidationResult(
                 success=False,
                 data={},
@@ -139,7 +411,8 @@ class AddressValidatorClient:
                 processing_time=time.time() - start_time
             )
         except Exception as e:
-            self.failed_requests += 1
+            with self._stats_lock:
+                self.failed_requests += 1
             return ValidationResult(
                 success=False,
                 data={},
@@ -147,13 +420,235 @@ class AddressValidatorClient:
                 processing_time=time.time() - start_time
             )
     
-    def health_check(self) -> ValidationResult:
+    def _handle_async_response(self, status_code: int, data: Dict,
+                               rate_limit_remaining: Optional[int],
+                               processing_time: float) -> ValidationResult:
+        """Map an async response to ValidationResult (mirrors _make_request)"""
+        if status_code == 200:
+            with self._stats_lock:
+                self.successful_requests += 1
+            return ValidationResult(
+                success=True,
+                data=data,
+                rate_limit_remaining=rate_limit_remaining,
+                processing_time=processing_time
+            )
+        elif status_code == 401:
+            error_msg = "Invalid API key. Please check your credentials."
+        elif status_code == 403:
+            error_msg = "Access forbidden. Feature may not be available in your tier."
+        elif status_code == 429:
+            error_msg = "Rate limit exceeded. Please slow down your requests."
+        else:
+            error_msg = data.get('detail', {}).get('message', f"HTTP {status_code}") \
+                if isinstance(data, dict) else f"HTTP {status_code}"
+
+        with self._stats_lock:
+            self.failed_requests += 1
+        return ValidationResult(
+            success=False,
+            data={},
+            error=error_msg,
+            rate_limit_remaining=rate_limit_remaining,
+            processing_time=processing_time
+        )
+
+    def _get_aio_session(self, concurrency: int) -> aiohttp.ClientSession:
+        """Get or lazily create the shared aiohttp session
+
+        aiohttp sessions are bound to the event loop they were created
+        on, and each asyncio.run() call uses a fresh loop — so a session
+        left over from a previous run is replaced rather than reused
+        against its now-closed loop.
+        """
+        loop = asyncio.get_running_loop()
+        if (self._aio_session is None or self._aio_session.closed
+                or self._aio_session_loop is not loop):
+            self._aio_session_loop = loop
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60),
+                headers={
+                    'Authorization': f'Bearer {self.api_key}',
+                    'Content-Type': 'application/json',
+                    'User-Agent': 'AddressValidatorClient/2.0.0'
+                },
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._aio_session
+
+    async def _amake_request(self, session: aiohttp.ClientSession, method: str,
+                             endpoint: str, **kwargs) -> ValidationResult:
+        """Async counterpart of _make_request"""
+        start_time = time.time()
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            with self._stats_lock:
+                self.total_requests += 1
+            async with session.request(method, url, **kwargs) as response:
+                rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
+                if rate_limit_remaining:
+                    rate_limit_remaining = int(rate_limit_remaining)
+
+                try:
+                    data = await response.json(content_type=None)
+                except Exception:
+                    data = {}
+
+                return self._handle_async_response(
+                    response.status, data, rate_limit_remaining,
+                    time.time() - start_time
+                )
+
+        except asyncio.TimeoutError:
+            with self._stats_lock:
+                self.failed_requests += 1
+            return ValidationResult(
+                success=False,
+                data={},
+                error="Request timeout. Please try again.",
+                processing_time=time.time() - start_time
+            )
+        except aiohttp.ClientConnectionError:
+            with self._stats_lock:
+                self.failed_requests += 1
+            return ValidationResult(
+                success=False,
+                data={},
+                error="Connection error. Please check your internet connection.",
+                processing_time=time.time() - start_time
+            )
+        except Exception as e:
+            with self._stats_lock:
+                self.failed_requests += 1
+            return ValidationResult(
+                success=False,
+                data={},
+                error=f"Unexpected error: {str(e)}",
+                processing_time=time.time() - start_time
+            )
+
+    async def avalidate_address(self,
+                                line1: str,
+                                city: str,
+                                state_cd: str,
+                                zip_cd: str,
+                                line2: Optional[str] = None,
+                                guid: Optional[str] = None,
+                                concurrency: int = 32) -> ValidationResult:
+        """
+        Async variant of validate_address
+
+        Args:
+            line1: Street address
+            city: City name
+            state_cd: State code or name
+            zip_cd: ZIP code
+            line2: Optional second address line
+            guid: Optional unique identifier
+            concurrency: Connection pool size for the shared session
+
+        Returns:
+            ValidationResult with address validation data
+        """
+        address = AddressRecord(
+            guid=guid or str(int(time.time())),
+            line1=line1,
+            line2=line2,
+            city=city,
+            state_cd=state_cd,
+            zip_cd=zip_cd
+        )
+
+        session = self._get_aio_session(concurrency)
+        return await self._amake_request(session, 'POST', '/api/validate-address',
+                                         json=_address_dict(address))
+
+    async def avalidate_addresses(self,
+                                  addresses: List[AddressRecord],
+                                  concurrency: int = 32) -> List[ValidationResult]:
+        """
+        Validate many addresses concurrently, one request per record
+
+        Overlaps the network round-trips with bounded concurrency instead of
+        serializing them, which is where the time goes on large batches.
+
+        Args:
+            addresses: List of AddressRecord objects
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of ValidationResult in the same order as the input
+        """
+        session = self._get_aio_session(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _validate_one(addr: AddressRecord) -> ValidationResult:
+            async with semaphore:
+                return await self._amake_request(session, 'POST', '/api/validate-address',
+                                                 json=_address_dict(addr))
+
+        results = await asyncio.gather(
+            *[_validate_one(addr) for addr in addresses],
+            return_exceptions=True
+        )
+
+        return [
+            result if isinstance(result, ValidationResult)
+            else ValidationResult(success=False, data={}, error=f"Unexpected error: {result}")
+            for result in results
+        ]
+
+    async def aclose(self):
+        """Close the shared aiohttp session, if one was created"""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+
+    def _cached_get(self, endpoint: str, ttl: float) -> ValidationResult:
+        """GET an endpoint, reusing a successful response for ttl seconds"""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(endpoint)
+            if cached is not None and now - cached[0] < ttl:
+                return cached[1]
+        result = self._make_request('GET', endpoint)
+        if result.success:
+            with self._cache_lock:
+                self._cache[endpoint] = (now, result)
+        return result
+
+    def _single_flight(self, key: str, fn) -> ValidationResult:
+        """Collapse concurrent identical requests into one round trip
+
+        The first caller for a key performs the request; callers arriving
+        while it is in flight block on the same Future and share the result.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def health_check(self, ttl: float = 5) -> ValidationResult:
         """Check API health and availability"""
-        return self._make_request('GET', '/health')
+        return self._cached_get('/health', ttl)
     
-    def get_api_info(self) -> ValidationResult:
+    def get_api_info(self, ttl: float = 60) -> ValidationResult:
         """Get API information and usage statistics"""
-        return self._make_request('GET', '/api-info')
+        return self._cached_get('/api-info', ttl)
     
     def validate_address(self, 
                         line1: str, 
@@ -185,21 +680,83 @@ class AddressValidatorClient:
             zip_cd=zip_cd
         )
         
-        return self._make_request('POST', '/api/validate-address', json=address.__dict__)
+        payload = _address_dict(address)
+        key = hashlib.blake2b(
+            json.dumps(payload, sort_keys=True).encode()
+        ).hexdigest()
+        return self._single_flight(
+            key,
+            lambda: self._make_request('POST', '/api/validate-address',
+                                       json=payload)
+        )
+    
+    def _post_address_chunk(self, chunk: List[AddressRecord]) -> ValidationResult:
+        """POST one chunk of addresses, pre-serialized with orjson"""
+        # Pre-serialize with orjson; the stdlib json encoder requests
+        # would otherwise use dominates CPU on 1000-record batches
+        payload = orjson.dumps({"addresses": [_address_dict(addr) for addr in chunk]})
+        return self._make_request('POST', '/api/batch-validate-addresses', 
+                                data=payload)
     
-    def validate_addresses_batch(self, addresses: List[AddressRecord]) -> ValidationResult:
+    def validate_addresses_batch(self, addresses: List[AddressRecord],
+                                 chunk_size: int = 1000,
+                                 max_workers: int = 8) -> ValidationResult:
         """
         Validate multiple addresses (requires premium/enterprise tier)
         
+        Lists larger than chunk_size are split and posted in parallel
+        through the connection pool, then merged into one result.
+        
         Args:
             addresses: List of AddressRecord objects
+            chunk_size: Records per request (matches the API's batch limit)
+            max_workers: Concurrent chunk uploads for oversized lists
             
         Returns:
             ValidationResult with batch validation data
         """
-        address_data = [addr.__dict__ for addr in addresses]
-        return self._make_request('POST', '/api/batch-validate-addresses', 
-                                json={"addresses": address_data})
+        if len(addresses) <= chunk_size:
+            return self._post_address_chunk(addresses)
+        
+        start_time = time.time()
+        chunks = [addresses[i:i + chunk_size]
+                  for i in range(0, len(addresses), chunk_size)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            chunk_results = list(pool.map(self._post_address_chunk, chunks))
+        
+        # Merge per-chunk categorized_results lists into one payload
+        merged: Dict[str, list] = {}
+        errors = []
+        rate_limit_remaining = None
+        for result in chunk_results:
+            if not result.success:
+                errors.append(result.error)
+                continue
+            if result.rate_limit_remaining is not None:
+                rate_limit_remaining = result.rate_limit_remaining
+            for key, items in result.data.get('categorized_results', {}).items():
+                if isinstance(items, list):
+                    merged.setdefault(key, []).extend(items)
+        
+        if not merged and errors:
+            return ValidationResult(
+                success=False,
+                data={},
+                error=f"All {len(chunks)} chunks failed: {errors[0]}",
+                processing_time=time.time() - start_time
+            )
+        
+        return ValidationResult(
+            success=True,
+            data={
+                'categorized_results': merged,
+                'chunks': len(chunks),
+                'failed_chunks': len(errors),
+                'chunk_errors': errors
+            },
+            rate_limit_remaining=rate_limit_remaining,
+            processing_time=time.time() - start_time
+        )
     
     def validate_name(self, 
                      full_name: str,
@@ -228,8 +785,15 @@ class AddressValidatorClient:
             parse_ind=parse_ind
         )
         
-        return self._make_request('POST', '/api/validate-names', 
-                                json={"names": [name.__dict__]})
+        payload = _name_dict(name)
+        key = hashlib.blake2b(
+            json.dumps(payload, sort_keys=True).encode()
+        ).hexdigest()
+        return self._single_flight(
+            key,
+            lambda: self._make_request('POST', '/api/validate-names',
+                                       data=orjson.dumps({"names": [payload]}))
+        )
     
     def validate_names_batch(self, names: List[NameRecord]) -> ValidationResult:
         """
@@ -241,9 +805,9 @@ class AddressValidatorClient:
         Returns:
             ValidationResult with batch name validation data
         """
-        names_data = [name.__dict__ for name in names]
+        payload = orjson.dumps({"names": [_name_dict(name) for name in names]})
         return self._make_request('POST', '/api/validate-names', 
-                                json={"names": names_data})
+                                data=payload)
     
     def upload_csv_file(self, file_path: Union[str, Path]) -> ValidationResult:
         """
@@ -271,14 +835,16 @@ class AddressValidatorClient:
                 error="File must be a CSV file"
             )
         
-        files = {'files': (file_path.name, open(file_path, 'rb'), 'text/csv')}
-        
-        try:
-            return self._make_request('POST', '/api/batch-validate-addresses', files=files)
-        finally:
-            # Ensure file is closed
-            if 'files' in locals():
-                files['files'][1].close()
+        # Stream the file through a MultipartEncoder instead of letting
+        # requests buffer the whole CSV in memory; the with block closes
+        # the handle even if the request raises
+        with open(file_path, 'rb') as fh:
+            encoder = MultipartEncoder(
+                fields={'files': (file_path.name, fh, 'text/csv')}
+            )
+            return self._make_request('POST', '/api/batch-validate-addresses',
+                                      data=encoder,
+                                      headers={'Content-Type': encoder.content_type})
     
     def upload_csv_data(self, csv_data: str, filename: str = "data.csv") -> ValidationResult:
         """
@@ -291,16 +857,18 @@ class AddressValidatorClient:
         Returns:
             ValidationResult with batch processing data
         """
-        files = {'files': (filename, io.StringIO(csv_data), 'text/csv')}
+        # Encode once up front; a StringIO body would make requests
+        # re-encode every byte while streaming the multipart payload
+        files = {'files': (filename, io.BytesIO(csv_data.encode('utf-8')), 'text/csv')}
         return self._make_request('POST', '/api/batch-validate-addresses', files=files)
     
-    def get_usage_stats(self) -> ValidationResult:
+    def get_usage_stats(self, ttl: float = 10) -> ValidationResult:
         """Get detailed usage statistics"""
-        return self._make_request('GET', '/api/usage-stats')
+        return self._cached_get('/api/usage-stats', ttl)
     
-    def get_examples(self) -> ValidationResult:
+    def get_examples(self, ttl: float = 3600) -> ValidationResult:
         """Get API usage examples"""
-        return self._make_request('GET', '/api/examples')
+        return self._cached_get('/api/examples', ttl)
     
     def export_results_to_csv(self, results: Dict, output_path: Union[str, Path]) -> bool:
         """
@@ -316,78 +884,51 @@ class AddressValidatorClient:
         try:
             output_path = Path(output_path)
             
-            # Extract results data
-            if 'categorized_results' in results:
-                all_results = []
-                
-                # Add USPS validated addresses
-                for result in results['categorized_results'].get('usps_validated_addresses', []):
-                    all_results.append({
-                        'source_file': result.get('source_file', ''),
-                        'row_number': result.get('row_number', ''),
-                        'category': 'US_USPS_Validated',
-                        'input_address': result.get('input_address', ''),
-                        'output_address': result.get('standardized_address', ''),
-                        'usps_valid': result.get('usps_valid', False),
-                        'county': result.get('county', ''),
-                        'is_residential': result.get('is_residential', ''),
-                        'error_message': result.get('error_message', '')
-                    })
-                
-                # Add international addresses
-                for result in results['categorized_results'].get('international_addresses', []):
-                    all_results.append({
-                        'source_file': result.get('source_file', ''),
-                        'row_number': result.get('row_number', ''),
-                        'category': 'International',
-                        'input_address': result.get('complete_address', ''),
-                        'output_address': result.get('complete_address', ''),
-                        'usps_valid': False,
-                        'county': '',
-                        'is_residential': '',
-                        'error_message': ''
-                    })
-                
-                # Add invalid addresses
-                for result in results['categorized_results'].get('invalid_addresses', []):
-                    issues = result.get('issues', [])
-                    issues_text = '; '.join(issues) if isinstance(issues, list) else str(issues)
-                    
-                    all_results.append({
-                        'source_file': result.get('source_file', ''),
-                        'row_number': result.get('row_number', ''),
-                        'category': 'Invalid',
-                        'input_address': result.get('complete_address', ''),
-                        'output_address': '',
-                        'usps_valid': False,
-                        'county': '',
-                        'is_residential': '',
-                        'error_message': issues_text
-                    })
-                
-                # Write to CSV
-                if all_results:
-                    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                        fieldnames = all_results[0].keys()
-                        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(all_results)
-                    
-                    return True
+            if 'categorized_results' not in results:
+                return False
             
-            return False
+            categorized = results['categorized_results']
+            has_rows = any(
+                categorized.get(key)
+                for key in ('usps_validated_addresses', 'international_addresses',
+                            'invalid_addresses')
+            )
+            if not has_rows:
+                return False
+            
+            # Stream rows straight to disk instead of materializing the
+            # full result list; large write buffer cuts syscall count
+            with open(output_path, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDS)
+                writer.writerows(_iter_rows(results))
+            
+            return True
             
         except Exception as e:
             print(f"Error exporting to CSV: {e}")
             return False
     
+    def reset_auth_block(self) -> None:
+        """Clear the cached auth failure, e.g. after fixing the API key"""
+        self._auth_blocked_until = 0.0
+
     def get_client_stats(self) -> Dict:
         """Get client-side usage statistics"""
+        # Snapshot under one lock so success_rate's numerator and
+        # denominator come from the same instant
+        with self._stats_lock:
+            total = self.total_requests
+            successful = self.successful_requests
+            failed = self.failed_requests
+            retried = self.retried_requests
         return {
-            'total_requests': self.total_requests,
-            'successful_requests': self.successful_requests,
-            'failed_requests': self.failed_requests,
-            'success_rate': (self.successful_requests / self.total_requests) if self.total_requests > 0 else 0
+            'total_requests': total,
+            'successful_requests': successful,
+            'failed_requests': failed,
+            'retried_requests': retried,
+            'success_rate': (successful / total) if total > 0 else 0
         }
 
 # =============================================================================
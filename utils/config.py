@@ -3,13 +3,38 @@
 Simplified configuration for Docker testing
 """
 
+import functools
+import importlib.util
 import os
+import re
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
+# Single-pass scan for the two USPS keys; compiled once at import
+_DOTENV_RE = re.compile(rb'^(USPS_CLIENT_(?:ID|SECRET))\s*=\s*["\']?([^"\'\n]+)', re.M)
 
+# Ignore empty or implausibly large .env files
+_DOTENV_MAX_BYTES = 1 << 20
+
+
+def _parse_dotenv(path: Path) -> Dict[str, str]:
+    """Extract the USPS keys from a .env file in one regex pass"""
+    size = path.stat().st_size
+    if size == 0 or size > _DOTENV_MAX_BYTES:
+        return {}
+    data = path.read_bytes()
+    return {key.decode(): value.decode().strip()
+            for key, value in _DOTENV_RE.findall(data)}
+
+
+@functools.lru_cache(maxsize=1)
 def load_usps_credentials() -> Tuple[Optional[str], Optional[str]]:
-    """Load USPS credentials - simplified for Docker"""
+    """Load USPS credentials - simplified for Docker
+    
+    Cached for the process lifetime: callers on request paths get the
+    resolved tuple back without re-reading files or re-importing the
+    optional streamlit/toml packages.
+    """
     
     print("🔍 Loading USPS credentials...")
     
@@ -26,14 +51,7 @@ def load_usps_credentials() -> Tuple[Optional[str], Optional[str]]:
         env_path = Path('.env')
         if env_path.exists():
             print("🔍 Trying .env file...")
-            env_vars = {}
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        env_vars[key.strip()] = value.strip().strip('"').strip("'")
-            
+            env_vars = _parse_dotenv(env_path)
             client_id = env_vars.get('USPS_CLIENT_ID', '')
             client_secret = env_vars.get('USPS_CLIENT_SECRET', '')
             if client_id and client_secret:
@@ -42,41 +60,43 @@ def load_usps_credentials() -> Tuple[Optional[str], Optional[str]]:
     except Exception as e:
         print(f"⚠️ Failed to load from .env file: {str(e)}")
     
-    # Try Streamlit secrets only if streamlit is available
-    try:
-        import streamlit as st
-        if hasattr(st, 'secrets'):
-            client_id = st.secrets.get("USPS_CLIENT_ID", "")
-            client_secret = st.secrets.get("USPS_CLIENT_SECRET", "")
-            if client_id and client_secret:
-                print("✅ USPS credentials loaded from Streamlit secrets")
-                return client_id, client_secret
-    except ImportError:
+    # Try Streamlit secrets only if streamlit is available; find_spec
+    # avoids paying for a failed import in the API container
+    if importlib.util.find_spec('streamlit') is not None:
+        try:
+            import streamlit as st
+            if hasattr(st, 'secrets'):
+                client_id = st.secrets.get("USPS_CLIENT_ID", "")
+                client_secret = st.secrets.get("USPS_CLIENT_SECRET", "")
+                if client_id and client_secret:
+                    print("✅ USPS credentials loaded from Streamlit secrets")
+                    return client_id, client_secret
+        except Exception as e:
+            print(f"⚠️ Failed to load from Streamlit secrets: {str(e)}")
+    else:
         # Streamlit not available (probably in API container)
         print("ℹ️ Streamlit not available - skipping Streamlit secrets")
-    except Exception as e:
-        print(f"⚠️ Failed to load from Streamlit secrets: {str(e)}")
     
     # Try TOML files only if toml is available
-    try:
-        import toml
-        
-        # Try .streamlit/secrets.toml
-        secrets_toml_path = Path('.streamlit/secrets.toml')
-        if secrets_toml_path.exists():
-            print("🔍 Trying .streamlit/secrets.toml...")
-            config = toml.load(secrets_toml_path)
-            client_id = config.get('USPS_CLIENT_ID', '')
-            client_secret = config.get('USPS_CLIENT_SECRET', '')
-            if client_id and client_secret:
-                print("✅ USPS credentials loaded from .streamlit/secrets.toml")
-                return client_id, client_secret
-                
-    except ImportError:
+    if importlib.util.find_spec('toml') is not None:
+        try:
+            import toml
+            
+            # Try .streamlit/secrets.toml
+            secrets_toml_path = Path('.streamlit/secrets.toml')
+            if secrets_toml_path.exists():
+                print("🔍 Trying .streamlit/secrets.toml...")
+                config = toml.load(secrets_toml_path)
+                client_id = config.get('USPS_CLIENT_ID', '')
+                client_secret = config.get('USPS_CLIENT_SECRET', '')
+                if client_id and client_secret:
+                    print("✅ USPS credentials loaded from .streamlit/secrets.toml")
+                    return client_id, client_secret
+        except Exception as e:
+            print(f"⚠️ Failed to load TOML files: {str(e)}")
+    else:
         # TOML not available (probably in API container)
         print("ℹ️ TOML not available - skipping TOML files")
-    except Exception as e:
-        print(f"⚠️ Failed to load TOML files: {str(e)}")
     
     print("❌ USPS credentials not found in any location")
     print("💡 Available methods: environment variables, .env file")
@@ -108,10 +128,15 @@ class Config:
     USPS_VALIDATE_URL = 'https://apis.usps.com/addresses/v3/address'
     
     # US States
-    US_STATES = {
+    US_STATES = frozenset({
         'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
         'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
         'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
         'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
         'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-    }
\ No newline at end of file
+    })
+
+    @staticmethod
+    def is_us_state(code: str) -> bool:
+        """Check a state code; pre-uppercased input skips the .upper() copy"""
+        return code in Config.US_STATES or code.upper() in Config.US_STATES
\ No newline at end of file